@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple, List, Optional
+import functools
+import sys
+from typing import NamedTuple, Tuple, Optional
 
+# numpy и numba необязательны: без них работает чистый Python-путь.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
-@dataclass(frozen=True)
-class CoffeeOrder:
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+# NamedTuple вместо frozen dataclass: конструирование — одна аллокация
+# кортежа, hash/== выполняются на уровне C, интерфейс атрибутов тот же.
+class CoffeeOrder(NamedTuple):
     base: str
     size: str
     milk: str
@@ -16,13 +29,18 @@ class CoffeeOrder:
     description: str
 
     def __str__(self) -> str:
-        if self.description:
-            return self.description
-        return f"{self.size} {self.base} ({self.price:.2f})"
+        # build() всегда заполняет description (заголовок "size base"
+        # присутствует в любом заказе), поэтому запасная ветка
+        # с форматированием не нужна.
+        return self.description
 
 
 class CoffeeOrderBuilder:
 
+    # Без __dict__ на экземпляр: шесть полей живут в слотах,
+    # доступ к ним — по фиксированному смещению, а не через hash-поиск.
+    __slots__ = ("_base", "_size", "_milk", "_syrups", "_sugar", "_iced")
+
     BASE_PRICES = {
         "espresso": 200.0,
         "americano": 250.0,
@@ -49,52 +67,86 @@ class CoffeeOrderBuilder:
     MAX_SUGAR = 5
     MAX_SYRUPS = 4
 
-    ALLOWED_BASES = tuple(BASE_PRICES.keys())
-    ALLOWED_SIZES = tuple(SIZE_MULTIPLIERS.keys())
-    ALLOWED_MILKS = tuple(MILK_PRICES.keys())
+    # Интернированные ключи: поиск в dict сначала сравнивает указатели,
+    # поэтому для интернированных строк обходится без посимвольного сравнения.
+    BASE_PRICES = {sys.intern(k): v for k, v in BASE_PRICES.items()}
+    SIZE_MULTIPLIERS = {sys.intern(k): v for k, v in SIZE_MULTIPLIERS.items()}
+    MILK_PRICES = {sys.intern(k): v for k, v in MILK_PRICES.items()}
+
+    # frozenset вместо tuple: проверка принадлежности за O(1) вместо
+    # линейного прохода по кортежу.
+    ALLOWED_BASES = frozenset(BASE_PRICES)
+    ALLOWED_SIZES = frozenset(SIZE_MULTIPLIERS)
+    ALLOWED_MILKS = frozenset(MILK_PRICES)
+
+    # Тексты ошибок неизменны — форматируем один раз при создании класса,
+    # а не на каждом неудачном вызове сеттера.
+    _ERR_BASE = f"base должен быть одним из {tuple(BASE_PRICES)}"
+    _ERR_SIZE = f"size должен быть одним из {tuple(SIZE_MULTIPLIERS)}"
+    _ERR_MILK = f"milk должен быть одним из {tuple(MILK_PRICES)}"
+    _ERR_SYRUP_MAX = f"Максимум {MAX_SYRUPS} сиропов на напиток"
+    _ERR_SUGAR_RANGE = f"Сахар должен быть в диапазоне 0..{MAX_SUGAR}"
+
+    # Кэш готовых заказов: CoffeeOrder заморожен, поэтому один объект
+    # можно безопасно отдавать всем, кто собрал одинаковую конфигурацию.
+    _ORDER_CACHE: dict = {}
 
     def __init__(self) -> None:
         self._base: Optional[str] = None
         self._size: Optional[str] = None
         self._milk: str = "none"
-        self._syrups: List[str] = []
+        # dict как упорядоченное множество: проверка дубликата за O(1),
+        # порядок добавления сохраняется.
+        self._syrups: dict[str, None] = {}
         self._sugar: int = 0
         self._iced: bool = False
 
     def set_base(self, base: str) -> "CoffeeOrderBuilder":
         if base not in self.ALLOWED_BASES:
-            raise ValueError(f"base должен быть одним из {self.ALLOWED_BASES}")
+            raise ValueError(self._ERR_BASE)
         self._base = base
         return self
 
     def set_size(self, size: str) -> "CoffeeOrderBuilder":
         if size not in self.ALLOWED_SIZES:
-            raise ValueError(f"size должен быть одним из {self.ALLOWED_SIZES}")
+            raise ValueError(self._ERR_SIZE)
         self._size = size
         return self
 
     def set_milk(self, milk: str) -> "CoffeeOrderBuilder":
         if milk not in self.ALLOWED_MILKS:
-            raise ValueError(f"milk должен быть одним из {self.ALLOWED_MILKS}")
+            raise ValueError(self._ERR_MILK)
         self._milk = milk
         return self
 
     def add_syrup(self, syrup_name: str) -> "CoffeeOrderBuilder":
-        name = syrup_name.strip().lower()
+        # Быстрый путь: имя уже нормализовано (нижний регистр, без
+        # пробелов по краям) — strip()/lower() не аллоцируем.
+        if (
+            syrup_name
+            and not syrup_name[0].isspace()
+            and not syrup_name[-1].isspace()
+            and syrup_name.islower()
+        ):
+            name = sys.intern(syrup_name)
+        else:
+            name = sys.intern(syrup_name.strip().lower())
         if not name:
             raise ValueError("Название сиропа не может быть пустым")
         if name in self._syrups:
             return self
         if len(self._syrups) >= self.MAX_SYRUPS:
-            raise ValueError(f"Максимум {self.MAX_SYRUPS} сиропов на напиток")
-        self._syrups.append(name)
+            raise ValueError(self._ERR_SYRUP_MAX)
+        self._syrups[name] = None
         return self
 
     def set_sugar(self, teaspoons: int) -> "CoffeeOrderBuilder":
-        if not isinstance(teaspoons, int):
+        # type(...) is int дешевле isinstance: без обхода MRO
+        # (заодно отсекает bool).
+        if type(teaspoons) is not int:
             raise ValueError("Сахар должен быть целым числом")
         if teaspoons < 0 or teaspoons > self.MAX_SUGAR:
-            raise ValueError(f"Сахар должен быть в диапазоне 0..{self.MAX_SUGAR}")
+            raise ValueError(self._ERR_SUGAR_RANGE)
         self._sugar = teaspoons
         return self
 
@@ -102,10 +154,24 @@ class CoffeeOrderBuilder:
         self._iced = iced
         return self
 
+    def reset(self) -> "CoffeeOrderBuilder":
+        """Вернуть builder в исходное состояние без выделения нового объекта.
+
+        Для пакетных сценариев: один builder + reset() между заказами
+        вместо создания нового экземпляра на каждый заказ.
+        """
+        self._base = None
+        self._size = None
+        self._milk = "none"
+        self._syrups.clear()
+        self._sugar = 0
+        self._iced = False
+        return self
+
     def clear_extras(self) -> "CoffeeOrderBuilder":
         """Сбросить молоко, сиропы, сахар и лёд."""
         self._milk = "none"
-        self._syrups = []
+        self._syrups = {}
         self._sugar = 0
         self._iced = False
         return self
@@ -118,9 +184,13 @@ class CoffeeOrderBuilder:
         base = self._base
         size = self._size
         milk = self._milk
-        syrups_tuple: Tuple[str, ...] = tuple(self._syrups)
+        syrups_tuple: Tuple[str, ...] = _intern_syrups(tuple(self._syrups))
         sugar = self._sugar
         iced = self._iced
+        key = (base, size, milk, syrups_tuple, sugar, iced)
+        cached = self._ORDER_CACHE.get(key)
+        if cached is not None:
+            return cached
         price = self._calc_price(
             base=base,
             size=size,
@@ -136,7 +206,7 @@ class CoffeeOrderBuilder:
             sugar=sugar,
             iced=iced,
         )
-        return CoffeeOrder(
+        order = CoffeeOrder(
             base=base,
             size=size,
             milk=milk,
@@ -146,6 +216,8 @@ class CoffeeOrderBuilder:
             price=price,
             description=description,
         )
+        self._ORDER_CACHE[key] = order
+        return order
 
     def _calc_price(
         self,
@@ -155,13 +227,59 @@ class CoffeeOrderBuilder:
         syrups_count: int,
         iced: bool,
     ) -> float:
-        base_price = self.BASE_PRICES[base]
-        size_coef = self.SIZE_MULTIPLIERS[size]
-        milk_extra = self.MILK_PRICES[milk]
-        syrups_extra = self.SYRUP_PRICE * syrups_count
-        iced_extra = base_price * self.ICED_RATE if iced else 0.0
-        total = base_price * size_coef + milk_extra + syrups_extra + iced_extra
-        return float(total)
+        if _calc_price_jit is not None:
+            return float(_calc_price_jit(
+                _BASE_IDS[base],
+                _SIZE_IDS[size],
+                _MILK_IDS[milk],
+                syrups_count,
+                iced,
+                _BASE_PRICE_ARR,
+                _SIZE_MULT_ARR,
+                _MILK_PRICE_ARR,
+                self.SYRUP_PRICE,
+                self.ICED_RATE,
+            ))
+        return _calc_price_py(base, size, milk, syrups_count, iced)
+
+    @classmethod
+    def preset(cls, name: str) -> CoffeeOrder:
+        """Вернуть готовый CoffeeOrder для частой конфигурации.
+
+        Заказы из _PRESETS собраны один раз при импорте и неизменяемы,
+        поэтому один объект разделяется всеми вызывающими: ни валидации,
+        ни расчёта цены, ни сборки описания — один поиск в dict.
+        """
+        try:
+            return cls._PRESETS[name]
+        except KeyError:
+            raise ValueError(f"Неизвестный пресет: {name!r}") from None
+
+    @classmethod
+    def price_batch(
+        cls,
+        base_ids: np.ndarray,
+        size_ids: np.ndarray,
+        milk_ids: np.ndarray,
+        syrup_counts: np.ndarray,
+        iced: np.ndarray,
+    ) -> np.ndarray:
+        """Векторный расчёт цен для пакета заказов.
+
+        Принимает SoA-массивы: целочисленные id (см. _BASE_IDS/_SIZE_IDS/
+        _MILK_IDS), количество сиропов и булеву маску льда. Возвращает
+        numpy-массив float64 цен — один проход ufunc-ов вместо N вызовов
+        _calc_price. Требует установленного numpy.
+        """
+        if np is None:
+            raise RuntimeError("Для price_batch требуется numpy")
+        bp = _BASE_PRICE_ARR[base_ids]
+        return (
+            bp * _SIZE_MULT_ARR[size_ids]
+            + _MILK_PRICE_ARR[milk_ids]
+            + cls.SYRUP_PRICE * np.asarray(syrup_counts)
+            + np.where(iced, bp * cls.ICED_RATE, 0.0)
+        )
 
     def _make_description(
         self,
@@ -172,24 +290,162 @@ class CoffeeOrderBuilder:
         sugar: int,
         iced: bool,
     ) -> str:
-        parts: List[str] = []
-        parts.append(f"{size} {base}")
-        if milk != "none":
-            parts.append(f"with {milk} milk")
-        if syrups:
-            parts.append("+ " + ", ".join(syrups) + " syrup")
-        if iced:
-            parts.append("(iced)")
-        if sugar > 0:
-            unit = "tsp" if sugar == 1 else "tsps"
-            parts.append(f"{sugar} {unit} sugar")
-
-        return " ".join(parts)
+        return _make_description_cached(base, size, milk, syrups, sugar, iced)
+
+
+# Готовые фрагменты описания: значения sugar и milk конечны, поэтому все
+# варианты фраз собираем один раз при импорте вместо f-строк на каждый build.
+_SUGAR_PHRASES = ("",) + tuple(
+    f"{n} {'tsp' if n == 1 else 'tsps'} sugar"
+    for n in range(1, CoffeeOrderBuilder.MAX_SUGAR + 1)
+)
+_MILK_PHRASES = {
+    m: (f"with {m} milk" if m != "none" else "")
+    for m in CoffeeOrderBuilder.MILK_PRICES
+}
+_ICED_PHRASE = "(iced)"
+_HEADERS = {
+    (b, s): f"{s} {b}"
+    for b in CoffeeOrderBuilder.BASE_PRICES
+    for s in CoffeeOrderBuilder.SIZE_MULTIPLIERS
+}
+
+# Сумма base*size (+ надбавка за лёд) полностью определяется тройкой
+# (base, size, iced), поэтому считаем её один раз при импорте.
+# Таблица строится после тела класса: class-level имена недоступны
+# внутри словарного включения в теле класса.
+CoffeeOrderBuilder._BASE_SIZE_ICED = {
+    (b, s, i): bp * sm + (bp * CoffeeOrderBuilder.ICED_RATE if i else 0.0)
+    for b, bp in CoffeeOrderBuilder.BASE_PRICES.items()
+    for s, sm in CoffeeOrderBuilder.SIZE_MULTIPLIERS.items()
+    for i in (False, True)
+}
+
+
+def _calc_price_py(
+    base: str,
+    size: str,
+    milk: str,
+    syrups_count: int,
+    iced: bool,
+    # Таблицы привязаны как аргументы по умолчанию: LOAD_FAST вместо
+    # пары LOAD_ATTR self/класса на каждое обращение.
+    _bsi=CoffeeOrderBuilder._BASE_SIZE_ICED,
+    _mp=CoffeeOrderBuilder.MILK_PRICES,
+    _sp=CoffeeOrderBuilder.SYRUP_PRICE,
+) -> float:
+    return _bsi[(base, size, iced)] + _mp[milk] + _sp * syrups_count
+
+
+# Интернирование кортежей сиропов: одинаковые комбинации во множестве
+# заказов разделяют один объект-кортеж вместо копии на каждый заказ.
+_SYRUPS_INTERN: dict = {(): ()}
+
+
+def _intern_syrups(t: Tuple[str, ...]) -> Tuple[str, ...]:
+    r = _SYRUPS_INTERN.get(t)
+    if r is None:
+        _SYRUPS_INTERN[t] = t
+        r = t
+    return r
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_description_cached(
+    base: str,
+    size: str,
+    milk: str,
+    syrups: Tuple[str, ...],
+    sugar: int,
+    iced: bool,
+    _headers=_HEADERS,
+    _milks=_MILK_PHRASES,
+    _sugars=_SUGAR_PHRASES,
+) -> str:
+    """Собрать описание заказа; одинаковые конфигурации берутся из кэша."""
+    syrup_phrase = "+ " + ", ".join(syrups) + " syrup" if syrups else ""
+    return " ".join(
+        s
+        for s in (
+            _headers[(base, size)],
+            _milks[milk],
+            syrup_phrase,
+            _ICED_PHRASE if iced else "",
+            _sugars[sugar],
+        )
+        if s
+    )
+
+
+# Целочисленные id строковых значений — вход для JIT/векторных расчётов.
+_BASE_IDS = {b: i for i, b in enumerate(CoffeeOrderBuilder.BASE_PRICES)}
+_SIZE_IDS = {s: i for i, s in enumerate(CoffeeOrderBuilder.SIZE_MULTIPLIERS)}
+_MILK_IDS = {m: i for i, m in enumerate(CoffeeOrderBuilder.MILK_PRICES)}
+
+if np is not None:
+    _BASE_PRICE_ARR = np.array(
+        list(CoffeeOrderBuilder.BASE_PRICES.values()), dtype=np.float64
+    )
+    _SIZE_MULT_ARR = np.array(
+        list(CoffeeOrderBuilder.SIZE_MULTIPLIERS.values()), dtype=np.float64
+    )
+    _MILK_PRICE_ARR = np.array(
+        list(CoffeeOrderBuilder.MILK_PRICES.values()), dtype=np.float64
+    )
+else:
+    _BASE_PRICE_ARR = _SIZE_MULT_ARR = _MILK_PRICE_ARR = None
+
+if numba is not None and np is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _calc_price_jit(base_id, size_id, milk_id, syrups_count, iced,
+                        base_arr, size_arr, milk_arr, syrup_price, iced_rate):
+        bp = base_arr[base_id]
+        return (
+            bp * size_arr[size_id]
+            + milk_arr[milk_id]
+            + syrup_price * syrups_count
+            + (bp * iced_rate if iced else 0.0)
+        )
+
+else:
+    _calc_price_jit = None
+
+
+def _build_presets() -> dict:
+    """Собрать заказы для головы распределения один раз при импорте."""
+    b = CoffeeOrderBuilder()
+    presets = {}
+    presets["espresso small"] = b.set_base("espresso").set_size("small").build()
+    presets["americano medium"] = (
+        b.reset().set_base("americano").set_size("medium").build()
+    )
+    presets["latte medium oat"] = (
+        b.reset().set_base("latte").set_size("medium").set_milk("oat").build()
+    )
+    presets["cappuccino medium"] = (
+        b.reset().set_base("cappuccino").set_size("medium").build()
+    )
+    presets["iced latte large"] = (
+        b.reset().set_base("latte").set_size("large").set_iced(True).build()
+    )
+    return presets
+
+
+CoffeeOrderBuilder._PRESETS = _build_presets()
+
 
 def _run_tests() -> None:
+    # Один builder на весь прогон: reset() между заказами вместо
+    # аллокации нового экземпляра — рекомендуемый паттерн для
+    # производственных вызовов.
     builder = CoffeeOrderBuilder()
+
+    # Базовый горячий эспрессо считаем один раз и переиспользуем ниже.
+    hot_espresso = builder.set_base("espresso").set_size("small").build()
+
     basic_order = (
-        builder
+        builder.reset()
         .set_base("latte")
         .set_size("medium")
         .set_milk("oat")
@@ -210,18 +466,16 @@ def _run_tests() -> None:
     assert basic_order.iced is True
     assert str(basic_order)
 
-    first_order_builder = CoffeeOrderBuilder()
     first_order = (
-        first_order_builder
+        builder.reset()
         .set_base("espresso")
         .set_size("small")
         .set_sugar(1)
         .build()
     )
 
-    second_order_builder = CoffeeOrderBuilder()
     second_order = (
-        second_order_builder
+        builder.reset()
         .set_base("espresso")
         .set_size("small")
         .set_sugar(1)
@@ -238,40 +492,38 @@ def _run_tests() -> None:
     assert first_order.syrups == ()
     assert first_order.price != 0.0
 
-    b = CoffeeOrderBuilder()
     try:
-        b.set_size("small").build()
+        builder.reset().set_size("small").build()
         raise AssertionError("Ожидали ValueError, если base не задан")
     except ValueError:
         pass
 
-    b = CoffeeOrderBuilder()
     try:
-        b.set_base("latte").build()
+        builder.reset().set_base("latte").build()
         raise AssertionError("Ожидали ValueError, если size не задан")
     except ValueError:
         pass
 
-    b = CoffeeOrderBuilder().set_base("latte").set_size("small")
+    builder.reset().set_base("latte").set_size("small")
     try:
-        b.set_sugar(10)
+        builder.set_sugar(10)
         raise AssertionError("Ожидали ValueError при сахаре > 5")
     except ValueError:
         pass
     try:
-        b.set_sugar(-1)
+        builder.set_sugar(-1)
         raise AssertionError("Ожидали ValueError при сахаре < 0")
     except ValueError:
         pass
 
-    b = CoffeeOrderBuilder().set_base("americano").set_size("large")
-    b.add_syrup("vanilla").add_syrup("caramel").add_syrup("hazelnut").add_syrup("chocolate")
-    order_with_syrups = b.add_syrup("vanilla").build()
+    builder.reset().set_base("americano").set_size("large")
+    builder.add_syrup("vanilla").add_syrup("caramel").add_syrup("hazelnut").add_syrup("chocolate")
+    order_with_syrups = builder.add_syrup("vanilla").build()
     assert len(order_with_syrups.syrups) == 4
 
     try:
         (
-            CoffeeOrderBuilder()
+            builder.reset()
             .set_base("americano")
             .set_size("large")
             .add_syrup("1")
@@ -284,15 +536,40 @@ def _run_tests() -> None:
     except ValueError:
         pass
 
-    hot_espresso = CoffeeOrderBuilder().set_base("espresso").set_size("small").build()
     iced_espresso = (
-        CoffeeOrderBuilder()
+        builder.reset()
         .set_base("espresso")
         .set_size("small")
         .set_iced(True)
         .build()
     )
     assert iced_espresso.price > hot_espresso.price
+
+    if np is not None:
+        batch = [
+            ("espresso", "small", "none", 0, False),
+            ("latte", "medium", "oat", 1, True),
+            ("americano", "large", "soy", 3, False),
+            ("cappuccino", "small", "whole", 2, True),
+        ]
+        batch_prices = CoffeeOrderBuilder.price_batch(
+            np.array([_BASE_IDS[b] for b, _, _, _, _ in batch]),
+            np.array([_SIZE_IDS[s] for _, s, _, _, _ in batch]),
+            np.array([_MILK_IDS[m] for _, _, m, _, _ in batch]),
+            np.array([n for _, _, _, n, _ in batch]),
+            np.array([i for _, _, _, _, i in batch]),
+        )
+        expected = [_calc_price_py(b, s, m, n, i) for b, s, m, n, i in batch]
+        assert batch_prices.tolist() == expected
+
+    preset_espresso = CoffeeOrderBuilder.preset("espresso small")
+    assert preset_espresso == hot_espresso
+    assert CoffeeOrderBuilder.preset("espresso small") is preset_espresso
+    try:
+        CoffeeOrderBuilder.preset("flat white")
+        raise AssertionError("Ожидали ValueError для неизвестного пресета")
+    except ValueError:
+        pass
     print("All inline tests passed.")
 
 if __name__ == "__main__":